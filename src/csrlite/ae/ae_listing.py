@@ -75,7 +75,7 @@ def ae_listing_ard(
 
     # Filter observation to include only subjects in filtered population
     observation_filtered = observation_to_filter.filter(
-        pl.col(id_var_name).is_in(population_filtered[id_var_name].to_list())
+        pl.col(id_var_name).is_in(population_filtered[id_var_name].implode())
     )
 
     # Determine which observation columns to select
@@ -391,7 +391,8 @@ def study_plan_to_ae_listing(
     group_by = ["USUBJID"]
 
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     # Initialize parser
     parser = StudyPlanParser(study_plan)
@@ -467,7 +468,7 @@ def study_plan_to_ae_listing(
         if parameter:
             filename += f"_{parameter.replace(';', '_')}"
         filename += ".rtf"
-        output_file = str(Path(output_dir) / filename)
+        output_file = str(out_dir / filename)
 
         # Generate RTF
         rtf_path = ae_listing(
@@ -21,7 +21,11 @@ from pathlib import Path
 import polars as pl
 from rtflite import RTFDocument
 
-from ..common.count import count_subject, count_subject_with_observation
+from ..common.count import (
+    count_subject,
+    count_subject_with_observation,
+    format_summary_table,
+)
 from ..common.parse import StudyPlanParser
 from ..common.plan import StudyPlan
 from ..common.rtf import create_rtf_table_n_pct
@@ -72,10 +76,11 @@ def ae_specific_ard(
     group_var_name, group_var_label = group
     ae_term_var_name, ae_term_var_label = ae_term
 
-    # Apply common filters
+    # Apply common filters; the observation side stays lazy so the filters, the
+    # population membership check and the column selection run as one optimized query
     population_filtered, observation_to_filter = apply_common_filters(
         population=population,
-        observation=observation,
+        observation=observation.lazy(),
         population_filter=population_filter,
         observation_filter=observation_filter,
         parameter_filter=parameter_filter,
@@ -84,20 +89,46 @@ def ae_specific_ard(
     assert observation_to_filter is not None
 
     # Filter observation to include only subjects in filtered population
-    observation_filtered = observation_to_filter.filter(
-        pl.col(id_var_name).is_in(population_filtered[id_var_name].to_list())
-    ).with_columns(pl.col(ae_term_var_name).alias("__index__"))
+    observation_filtered = (
+        observation_to_filter.join(
+            population_filtered.lazy().select(id_var_name), on=id_var_name, how="semi"
+        )
+        .select(id_var_name, pl.col(ae_term_var_name).alias("__index__"))
+        .collect()
+    )
 
     # Note: We'll extract categories from concatenated result later for both __index__ and __group__
 
-    # Population counts - keep original for denominator calculations
-    n_pop_counts = count_subject(
-        population=population_filtered,
-        id=id_var_name,
-        group=group_var_name,
-        total=total,
-        missing_group=missing_group,
-    )
+    # AE term counts; every group appears in them together with its population size
+    n_index_counts: pl.DataFrame | None = None
+    if not observation_filtered.is_empty():
+        n_index_counts = count_subject_with_observation(
+            population=population_filtered,
+            observation=observation_filtered,
+            id=id_var_name,
+            group=group_var_name,
+            total=total,
+            variable="__index__",
+            missing_group=missing_group,
+        )
+
+    # Population counts - keep original for denominator calculations. Reuse the
+    # denominators carried by the AE term counts rather than validating and counting
+    # the population again; count it directly only when there is no observation.
+    if n_index_counts is None:
+        n_pop_counts = count_subject(
+            population=population_filtered,
+            id=id_var_name,
+            group=group_var_name,
+            total=total,
+            missing_group=missing_group,
+        )
+    else:
+        n_pop_counts = (
+            n_index_counts.select(group_var_name, "n_subj_pop")
+            .unique(group_var_name)
+            .sort(group_var_name)
+        )
 
     # Transform population counts for display
     n_pop = n_pop_counts.select(
@@ -112,75 +143,112 @@ def ae_specific_ard(
     )
 
     # Summary rows: "with one or more" and "with no" adverse events
-    # Count subjects with at least one event
-    subjects_with_events = observation_filtered.select(id_var_name).unique()
-
-    # Get population with event indicator
-    pop_with_indicator = population_filtered.with_columns(
-        pl.col(id_var_name)
-        .is_in(subjects_with_events[id_var_name].to_list())
-        .alias("__has_event__")
-    )
-
-    # Count subjects with and without events using count_subject_with_observation
-    event_counts = count_subject_with_observation(
-        population=population_filtered,
-        observation=pop_with_indicator,
-        id=id_var_name,
-        group=group_var_name,
-        variable="__has_event__",
-        total=total,
-        missing_group=missing_group,
+    # Flag subjects with at least one event and count them per group in one aggregation;
+    # subjects without events are the remainder of the population denominator
+    group_dtype = n_pop_counts.schema[group_var_name]
+    event_indicator = observation_filtered.select(
+        pl.col(id_var_name).unique(), pl.lit(True).alias("__has_event__")
     )
-
-    # Extract 'with' counts
-    n_with = event_counts.filter(pl.col("__has_event__") == "true").select(
-        [
-            pl.lit(n_with_label).alias("__index__"),
-            pl.col(group_var_name).cast(pl.String).alias("__group__"),
-            pl.col("n_pct_subj_fmt").alias("__value__"),
-        ]
+    pop_events = (
+        population_filtered.select(id_var_name, pl.col(group_var_name).cast(group_dtype))
+        .join(event_indicator, on=id_var_name, how="left")
+        .with_columns(pl.col("__has_event__").fill_null(False))
     )
-
-    # Extract 'without' counts
-    n_without = event_counts.filter(pl.col("__has_event__") == "false").select(
-        [
-            pl.lit(n_without_label).alias("__index__"),
-            pl.col(group_var_name).cast(pl.String).alias("__group__"),
-            pl.col("n_pct_subj_fmt").alias("__value__"),
-        ]
+    with_counts = pop_events.group_by(group_var_name).agg(
+        pl.col("__has_event__").sum().alias("n_with")
     )
+    if total:
+        with_counts = pl.concat(
+            [
+                with_counts,
+                pop_events.select(
+                    pl.lit("Total", dtype=group_dtype).alias(group_var_name),
+                    pl.col("__has_event__").sum().alias("n_with"),
+                ),
+            ]
+        )
 
-    # AE term counts
-    n_index = count_subject_with_observation(
-        population=population_filtered,
-        observation=observation_filtered,
-        id=id_var_name,
-        group=group_var_name,
-        total=total,
-        variable="__index__",
-        missing_group=missing_group,
-    )
+    event_counts = n_pop_counts.join(
+        with_counts, on=group_var_name, how="left", maintain_order="left"
+    ).with_columns(pl.col("n_with").fill_null(0))
+
+    # Long format ("true"/"false") for the shared formatter; as before, a row only
+    # appears when at least one subject falls into it
+    event_levels: list[tuple[str, pl.Expr]] = []
+    n_with_any = pop_events.get_column("__has_event__").sum()
+    if n_with_any > 0:
+        event_levels.append(("true", pl.col("n_with")))
+    if n_with_any < pop_events.height:
+        event_levels.append(("false", pl.col("n_subj_pop") - pl.col("n_with")))
+
+    event_parts = [
+        event_counts.select(
+            group_var_name,
+            pl.lit(level).alias("__has_event__"),
+            n_subj.alias("n_subj"),
+            "n_subj_pop",
+        )
+        for level, n_subj in event_levels
+    ]
+    if event_parts:
+        event_fmt = format_summary_table(
+            pl.concat(event_parts).with_columns(
+                pct_subj=(pl.col("n_subj") / pl.col("n_subj_pop") * 100)
+            ),
+            group=group_var_name,
+            variable="__has_event__",
+        )
+    else:
+        event_fmt = pl.DataFrame(
+            schema={
+                group_var_name: group_dtype,
+                "__has_event__": pl.String,
+                "n_pct_subj_fmt": pl.String,
+            }
+        )
 
-    n_index = n_index.select(
-        (
-            pl.col("__index__").cast(pl.String).str.slice(0, 1).str.to_uppercase()
-            + pl.col("__index__").cast(pl.String).str.slice(1).str.to_lowercase()
-        ).alias("__index__"),
+    # 'with' and 'without' rows in one projection, all 'with' rows first; the sort is
+    # stable, so each block keeps the group order of the formatter
+    n_events = event_fmt.sort("__has_event__", descending=True, maintain_order=True).select(
+        pl.col("__has_event__")
+        .replace_strict({"true": n_with_label, "false": n_without_label}, return_dtype=pl.String)
+        .alias("__index__"),
         pl.col(group_var_name).cast(pl.String).alias("__group__"),
         pl.col("n_pct_subj_fmt").alias("__value__"),
     )
 
-    # Concatenate all parts
-    parts = [n_pop, n_with, n_without, n_empty, n_index]
-
-    res = pl.concat(parts)
-
-    # Extract unique categories from concatenated result in order of appearance
-    index_categories = res.select("__index__").unique(maintain_order=True).to_series().to_list()
-    group_categories = res.select("__group__").unique(maintain_order=True).to_series().to_list()
+    # AE term rows
+    if n_index_counts is None:
+        n_index = n_empty.clear()
+    else:
+        # Reorder the group-major counts term-major so no global sort is needed later, and
+        # capitalize only the first letter (str.to_titlecase would capitalize every word)
+        term = pl.col("__index__").cast(pl.String)
+        n_index = n_index_counts.sort(
+            pl.col("__id__").min().over("__index__"), group_var_name
+        ).select(
+            pl.concat_str(
+                term.str.head(1).str.to_uppercase(), term.str.tail(-1).str.to_lowercase()
+            ).alias("__index__"),
+            pl.col(group_var_name).cast(pl.String).alias("__group__"),
+            pl.col("n_pct_subj_fmt").alias("__value__"),
+        )
 
-    # Convert to Enum types for proper categorical ordering and sorting
+    # Concatenate all parts; each is already in display order
+    res = pl.concat([n_pop, n_events, n_empty, n_index])
+
+    # Index categories in order of appearance, from the labels each part is known to
+    # carry; only the small event and AE term parts need scanning
+    index_labels = [
+        *([pop_var_name] if n_pop.height > 0 else []),
+        *n_events.get_column("__index__").unique(maintain_order=True),
+        *([""] if n_empty.height > 0 else []),
+        *n_index.get_column("__index__").unique(maintain_order=True),
+    ]
+    index_categories = list(dict.fromkeys(index_labels))
+    group_categories = n_pop.get_column("__group__").to_list()
+
+    # Convert to Enum types for proper categorical ordering downstream
     res = res.with_columns(
         [
             pl.col("__index__").cast(pl.Enum(index_categories)),
@@ -188,9 +256,6 @@ def ae_specific_ard(
         ]
     )
 
-    # Sort by index and group using categorical ordering
-    res = res.sort("__index__", "__group__")
-
     return res
 
 
@@ -207,11 +272,21 @@ def ae_specific_df(ard: pl.DataFrame) -> pl.DataFrame:
     Returns:
         pl.DataFrame: Wide-format display table with index rows and groups as columns
     """
-    # Pivot from long to wide format
-    df_wide = ard.pivot(index="__index__", on="__group__", values="__value__")
+    # Pivot from long to wide format; each (index, group) cell is unique, so no
+    # aggregation is needed
+    df_wide = ard.pivot(
+        on="__group__", index="__index__", values="__value__", aggregate_function=None
+    )
+
+    # An Enum group lists the output columns in display order
+    group_dtype = ard.schema["__group__"]
+    if isinstance(group_dtype, pl.Enum):
+        group_cols = [g for g in group_dtype.categories if g in df_wide.columns]
+    else:
+        group_cols = [c for c in df_wide.columns if c != "__index__"]
 
     # Rename __index__ to display column name
-    df_wide = df_wide.rename({"__index__": "Term"}).select(pl.col("Term"), pl.exclude("Term"))
+    df_wide = df_wide.rename({"__index__": "Term"}).select("Term", *group_cols)
 
     return df_wide
 
@@ -383,7 +458,8 @@ def study_plan_to_ae_specific(
     missing_group = "error"
 
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     # Initialize parser
     parser = StudyPlanParser(study_plan)
@@ -394,7 +470,14 @@ def study_plan_to_ae_specific(
     # Filter for AE specific analyses
     ae_plans = plan_df.filter(pl.col("analysis") == analysis)
 
+    if ae_plans.is_empty():
+        return []
+
+    # Get datasets using parser; they are shared by every analysis, so retrieve them once
+    population_df, observation_df = parser.get_datasets(population_df_name, observation_df_name)
+
     rtf_files = []
+    filtered_populations: dict[str, pl.DataFrame] = {}
 
     # Generate RTF for each analysis
     for row in ae_plans.iter_rows(named=True):
@@ -411,11 +494,16 @@ def study_plan_to_ae_specific(
                 f"Please add group to your YAML plan."
             )
 
-        # Get datasets using parser
-        population_df, observation_df = parser.get_datasets(population_df_name, observation_df_name)
+        # Filter each population once; analyses sharing it reuse the filtered frame
+        if population not in filtered_populations:
+            filtered_populations[population], _ = apply_common_filters(
+                population=population_df,
+                observation=None,
+                population_filter=parser.get_population_filter(population),
+                observation_filter=None,
+            )
 
         # Get filters and configuration using parser
-        population_filter = parser.get_population_filter(population)
         obs_filter = parser.get_observation_filter(observation)
 
         # Get parameter filter if parameter is specified
@@ -456,13 +544,13 @@ def study_plan_to_ae_specific(
         if parameter:
             filename += f"_{parameter.replace(';', '_')}"
         filename += ".rtf"
-        output_file = str(Path(output_dir) / filename)
+        output_file = str(out_dir / filename)
 
         # Generate RTF
         rtf_path = ae_specific(
-            population=population_df,
+            population=filtered_populations[population],
             observation=observation_df,
-            population_filter=population_filter,
+            population_filter=None,
             observation_filter=obs_filter,
             parameter_filter=parameter_filter,
             id=id,
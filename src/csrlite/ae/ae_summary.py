@@ -18,11 +18,12 @@ from pathlib import Path
 import polars as pl
 from rtflite import RTFDocument
 
+from ..common.config import config
 from ..common.count import count_subject, count_subject_with_observation
 from ..common.parse import StudyPlanParser
 from ..common.plan import StudyPlan
 from ..common.rtf import create_rtf_table_n_pct
-from ..common.utils import apply_common_filters
+from ..common.utils import apply_common_filters, sql_expr
 
 
 def study_plan_to_ae_summary(
@@ -56,7 +57,8 @@ def study_plan_to_ae_summary(
     missing_group = "error"
 
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     # Initialize parser
     parser = StudyPlanParser(study_plan)
@@ -67,7 +69,13 @@ def study_plan_to_ae_summary(
     # Filter for AE summary analyses
     ae_plans = plan_df.filter(pl.col("analysis") == analysis)
 
-    rtf_files = []
+    rtf_files: list[str] = []
+
+    if ae_plans.is_empty():
+        return rtf_files
+
+    # Get datasets using parser; they are shared by every analysis, so retrieve them once
+    population_df, observation_df = parser.get_datasets(population_df_name, observation_df_name)
 
     # Generate RTF for each analysis
     for row in ae_plans.iter_rows(named=True):
@@ -84,9 +92,6 @@ def study_plan_to_ae_summary(
                 "Please add group to your YAML plan."
             )
 
-        # Get datasets using parser
-        population_df, observation_df = parser.get_datasets(population_df_name, observation_df_name)
-
         # Get filters and configuration using parser
         population_filter = parser.get_population_filter(population)
         param_names, param_filters, param_labels, _ = parser.get_parameter_info(
@@ -118,7 +123,7 @@ def study_plan_to_ae_summary(
         if observation:
             filename += f"_{observation}"
         filename += f"_{parameter.replace(';', '_')}.rtf"
-        output_file = str(Path(output_dir) / filename)
+        output_file = str(out_dir / filename)
 
         # Generate RTF using the new ae_summary signature
         rtf_path = ae_summary(
@@ -260,33 +265,72 @@ def ae_summary_ard(
 
     assert observation_to_filter is not None
 
+    # Only the ID and group columns are needed downstream; project them once so the
+    # semi-join and the count helpers work on a narrow frame
+    population_filtered = population_filtered.select(id_var_name, group_var_name)
+
     # Filter observation data to include only subjects in the filtered population
-    # Process all variables in the list
-    observation_filtered_list = []
-    for variable_filter, variable_label in variables:
-        obs_filtered = (
-            observation_to_filter.filter(
-                pl.col(id_var_name).is_in(population_filtered[id_var_name].to_list())
-            )
-            .filter(pl.sql_expr(variable_filter))
-            .with_columns(pl.lit(variable_label).alias("__index__"))
+    observation_lf = observation_to_filter.lazy().join(
+        population_filtered.lazy().select(id_var_name), on=id_var_name, how="semi"
+    )
+
+    # Evaluate every variable filter as a boolean column in a single pass over the
+    # observations, then reshape to one (id, __index__) row per matching filter.
+    # Flags use positional names so duplicated or unusual labels cannot collide; the
+    # labels are only attached to the aggregated counts below.
+    flag_names = [f"__flag_{i}__" for i in range(len(variables))]
+    flag_labels = {name: label for name, (_, label) in zip(flag_names, variables)}
+    observation_filtered = (
+        observation_lf.select(
+            id_var_name,
+            *[
+                sql_expr(variable_filter).alias(name)
+                for name, (variable_filter, _) in zip(flag_names, variables)
+            ],
+        )
+        .unpivot(index=id_var_name, variable_name="__index__", value_name="__flag__")
+        .filter(pl.col("__flag__"))
+        .select(id_var_name, "__index__")
+        .collect(
+            engine="streaming"
+            if observation_to_filter.height > config.streaming_threshold
+            else "auto"
         )
+    )
 
-        observation_filtered_list.append(obs_filtered)
+    # Observation
+    n_obs_counts: pl.DataFrame | None = None
+    if observation_filtered.is_empty():
+        # No observation matches any variable filter, so the counting pipeline would
+        # produce no rows; count the population on its own
+        n_pop_counts = count_subject(
+            population=population_filtered,
+            id=id_var_name,
+            group=group_var_name,
+            total=total,
+            missing_group=missing_group,
+        )
+    else:
+        n_obs_counts = count_subject_with_observation(
+            population=population_filtered,
+            observation=observation_filtered,
+            id=id_var_name,
+            group=group_var_name,
+            total=total,
+            variable="__index__",
+            missing_group=missing_group,
+        )
 
-    # Concatenate all filtered observations
-    observation_filtered = pl.concat(observation_filtered_list)
+        # Every group appears in the observation counts together with its population size,
+        # so reuse it rather than validating and counting the population a second time
+        n_pop_counts = (
+            n_obs_counts.select(group_var_name, "n_subj_pop")
+            .unique(group_var_name)
+            .sort(group_var_name)
+        )
 
     # Population
-    n_pop = count_subject(
-        population=population_filtered,
-        id=id_var_name,
-        group=group_var_name,
-        total=total,
-        missing_group=missing_group,
-    )
-
-    n_pop = n_pop.select(
+    n_pop = n_pop_counts.select(
         pl.lit(pop_var_name).alias("__index__"),
         pl.col(group_var_name).alias("__group__"),
         pl.col("n_subj_pop").cast(pl.String).alias("__value__"),
@@ -297,32 +341,27 @@ def ae_summary_ard(
         pl.lit("").alias("__index__"), pl.col("__group__"), pl.lit("").alias("__value__")
     )
 
-    # Observation
-    n_obs = count_subject_with_observation(
-        population=population_filtered,
-        observation=observation_filtered,
-        id=id_var_name,
-        group=group_var_name,
-        total=total,
-        variable="__index__",
-        missing_group=missing_group,
-    )
-
-    n_obs = n_obs.select(
-        pl.col("__index__"),
-        pl.col(group_var_name).alias("__group__"),
-        pl.col("n_pct_subj_fmt").alias("__value__"),
-    )
-
-    res = pl.concat([n_pop, n_empty, n_obs])
+    if n_obs_counts is None:
+        n_obs = n_pop.clear()
+    else:
+        n_obs = n_obs_counts.select(
+            pl.col("__index__").replace_strict(flag_labels, return_dtype=pl.String),
+            pl.col(group_var_name).alias("__group__"),
+            pl.col("n_pct_subj_fmt").alias("__value__"),
+        )
 
     # Convert __index__ to ordered Enum based on appearance
     # Build the ordered categories list: population name, empty string, then variable labels
     variable_labels = [label for _, label in variables]
     ordered_categories = [pop_var_name, ""] + variable_labels
 
-    res = res.with_columns(pl.col("__index__").cast(pl.Enum(ordered_categories))).sort(
-        "__index__", "__group__"
+    # Stack, cast and sort in one lazy query; the sort produces a fresh frame,
+    # so the concatenation does not need to rechunk first
+    res = (
+        pl.concat([n_pop.lazy(), n_empty.lazy(), n_obs.lazy()], rechunk=False)
+        .with_columns(pl.col("__index__").cast(pl.Enum(ordered_categories)))
+        .sort("__index__", "__group__")
+        .collect()
     )
 
     return res
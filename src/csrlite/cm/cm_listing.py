@@ -72,7 +72,7 @@ def cm_listing_ard(
 
     # Filter observation to include only subjects in filtered population
     observation_filtered = observation_to_filter.filter(
-        pl.col(id_var_name).is_in(population_filtered[id_var_name].to_list())
+        pl.col(id_var_name).is_in(population_filtered[id_var_name].implode())
     )
 
     # Determine which observation columns to select
@@ -394,7 +394,8 @@ def study_plan_to_cm_listing(
     group_by = ["USUBJID"]
 
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     # Initialize parser
     parser = StudyPlanParser(study_plan)
@@ -470,7 +471,7 @@ def study_plan_to_cm_listing(
         if parameter:
             filename += f"_{parameter.replace(';', '_')}"
         filename += ".rtf"
-        output_file = str(Path(output_dir) / filename)
+        output_file = str(out_dir / filename)
 
         # Generate RTF
         rtf_path = cm_listing(
@@ -23,7 +23,7 @@ from ..common.count import count_subject, count_subject_with_observation
 from ..common.parse import StudyPlanParser
 from ..common.plan import StudyPlan
 from ..common.rtf import create_rtf_table_n_pct
-from ..common.utils import apply_common_filters
+from ..common.utils import apply_common_filters, sql_expr
 
 
 def study_plan_to_cm_summary(
@@ -54,7 +54,8 @@ def study_plan_to_cm_summary(
     missing_group = "error"
 
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     # Initialize parser
     parser = StudyPlanParser(study_plan)
@@ -126,7 +127,7 @@ def study_plan_to_cm_summary(
         if parameter:
             filename += f"_{parameter.replace(';', '_')}"
         filename += ".rtf"
-        output_file = str(Path(output_dir) / filename)
+        output_file = str(out_dir / filename)
 
         # Generate RTF
         rtf_path = cm_summary(
@@ -185,9 +186,9 @@ def cm_summary_ard(
     for variable_filter, variable_label in variables:
         obs_filtered = (
             observation_to_filter.filter(
-                pl.col(id_var_name).is_in(population_filtered[id_var_name].to_list())
+                pl.col(id_var_name).is_in(population_filtered[id_var_name].implode())
             )
-            .filter(pl.sql_expr(variable_filter))
+            .filter(sql_expr(variable_filter))
             .with_columns(pl.lit(variable_label).alias("__index__"))
         )
         observation_filtered_list.append(obs_filtered)
@@ -22,6 +22,18 @@ class CsrLiteConfig(BaseModel):
         default="__missing__", description="String to represent missing string values"
     )
 
+    # Query Execution
+    streaming_threshold: int = Field(
+        default=1_000_000,
+        description="Input row count above which lazy queries are collected with the "
+        "streaming engine",
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="Maximum number of worker threads used to read study plan datasets "
+        "(None lets Python choose based on the CPU count)",
+    )
+
     # Logging
     logging_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO", description="Default logging level"
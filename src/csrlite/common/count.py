@@ -14,11 +14,15 @@ def _to_pop(
     # prepare data
     pop = population.select(id, group)
 
-    # validate data
-    if pop[id].is_duplicated().any():
+    # validate data (ID uniqueness and group nulls in a single pass)
+    n_unique_id, n_missing_group = pop.select(
+        pl.col(id).n_unique(), pl.col(group).null_count()
+    ).row(0)
+
+    if n_unique_id != pop.height:
         raise ValueError(f"The '{id}' column in the population DataFrame is not unique.")
 
-    if missing_group == "error" and pop[group].is_null().any():
+    if missing_group == "error" and n_missing_group > 0:
         raise ValueError(
             f"Missing values found in the '{group}' column of the population DataFrame, "
             "and 'missing_group' is set to 'error'."
@@ -27,18 +31,28 @@ def _to_pop(
     # Convert group to Enum for consistent categorical ordering
     u_pop = pop[group].unique().sort().to_list()
 
-    # handle total column
-    if total:
-        pop_total = pop.with_columns(pl.lit("Total").alias(group))
-        pop = pl.concat([pop, pop_total]).with_columns(
-            pl.col(group).cast(pl.Enum(u_pop + ["Total"]))
-        )
-    else:
-        pop = pop.with_columns(pl.col(group).cast(pl.Enum(u_pop)))
+    # handle total column: only reserve the "Total" level here, callers aggregate it
+    # explicitly so the population rows are never duplicated
+    categories = u_pop + ["Total"] if total else u_pop
+    pop = pop.with_columns(pl.col(group).cast(pl.Enum(categories)))
 
     return pop
 
 
+def _count_pop(pop: pl.DataFrame, group: str, total: bool) -> pl.DataFrame:
+    # count subjects per group of a population already prepared by _to_pop
+    df_pop = pop.group_by(group).agg(pl.len().alias("n_subj_pop"))
+
+    # an empty population has no Total row, just as it has no group rows
+    if total and pop.height > 0:
+        df_total = pop.select(
+            pl.lit("Total", dtype=pop.schema[group]).alias(group), pl.len().alias("n_subj_pop")
+        )
+        df_pop = pl.concat([df_pop, df_total])
+
+    return df_pop.sort(group)
+
+
 def count_subject(
     population: pl.DataFrame,
     id: str,
@@ -68,7 +82,7 @@ def count_subject(
         missing_group=missing_group,
     )
 
-    return pop.group_by(group).agg(pl.len().alias("n_subj_pop")).sort(group)
+    return _count_pop(pop, group=group, total=total)
 
 
 def count_summary_data(
@@ -111,68 +125,80 @@ def count_summary_data(
     # Select all required columns (id + all variables)
     obs = observation.select(id, *variables).join(pop, on=id, how="left")
 
-    for var in variables:
-        obs = obs.with_columns(pl.col(var).cast(pl.String).fill_null(config.missing_str))
-
-    # Check for IDs in observation that are not in population
-    if not obs[id].is_in(pop[id].to_list()).all():
-        missing_ids = (
-            obs.filter(~pl.col(id).is_in(pop[id].to_list()))
-            .select(id)
-            .unique()
-            .to_series()
-            .to_list()
-        )
-        raise ValueError(
-            f"Some '{id}' values in the observation DataFrame are not present in the population: "
-            f"{missing_ids}"
-        )
+    obs = obs.with_columns(
+        [pl.col(var).cast(pl.String).fill_null(config.missing_str) for var in variables]
+    )
 
-    df_pop = count_subject(
-        population=population,
-        id=id,
-        group=group,
-        total=total,
-        missing_group=missing_group,
+    # Reuse the validated population instead of preparing it again via count_subject
+    df_pop = _count_pop(pop, group=group, total=total)
+
+    # Very large inputs are collected with the streaming engine to bound memory use
+    total_rows = obs.height + pop.height
+
+    # Build every hierarchy level lazily so all levels share a single query plan
+    obs_lf = obs.lazy()
+    df_pop_lf = df_pop.lazy()
+
+    # IDs in observation that are not in population (checked once both plans have run)
+    missing_ids_lf = (
+        obs_lf.select(id).unique(maintain_order=True).join(pop.lazy().select(id), on=id, how="anti")
     )
 
-    all_levels_df = []
+    all_levels_lf = []
 
     # Iterate through hierarchies
     for i in range(1, len(variables) + 1):
         current_vars = variables[:i]
 
         # Aggregation
-        df_obs_counts = obs.group_by(group, *current_vars).agg(
-            pl.len().alias("n_obs"), pl.n_unique(id).alias("n_subj")
-        )
+        count_exprs = [pl.len().alias("n_obs"), pl.n_unique(id).alias("n_subj")]
+        df_obs_counts = obs_lf.group_by(group, *current_vars).agg(count_exprs)
+
+        if total:
+            df_total_counts = (
+                obs_lf.group_by(current_vars)
+                .agg(count_exprs)
+                .select(
+                    pl.lit("Total", dtype=pop.schema[group]).alias(group),
+                    *current_vars,
+                    "n_obs",
+                    "n_subj",
+                )
+            )
+            df_obs_counts = pl.concat([df_obs_counts, df_total_counts])
 
-        # Cross join for all combinations
-        unique_groups = df_pop.select(group)
-        unique_variables = obs.select(current_vars).unique()
-        all_combinations = unique_groups.join(unique_variables, how="cross")
+        # Cross join for all combinations (df_pop already carries n_subj_pop per group)
+        unique_variables = obs_lf.select(current_vars).unique()
+        all_combinations = df_pop_lf.join(unique_variables, how="cross")
 
         # Join back
         df_level = (
             all_combinations.join(df_obs_counts, on=[group, *current_vars], how="left")
-            .join(df_pop, on=group, how="left")
             .with_columns([pl.col("n_obs").fill_null(0), pl.col("n_subj").fill_null(0)])
+            .select(group, *current_vars, "n_obs", "n_subj", "n_subj_pop")
         )
 
-        df_level = df_level.with_columns([pl.col(c).cast(pl.String) for c in current_vars])
+        all_levels_lf.append(df_level)
 
-        # Add missing columns with "__all__"
-        for var in variables:
-            if var not in df_level.columns:
-                df_level = df_level.with_columns(pl.lit("__all__").cast(pl.String).alias(var))
-
-        all_levels_df.append(df_level)
+    # Stack, fill the variables absent from a level with "__all__", and calculate percentage
+    df_obs_lf = (
+        pl.concat(all_levels_lf, how="diagonal")
+        .with_columns([pl.col(var).fill_null("__all__") for var in variables])
+        .with_columns(pct_subj=(pl.col("n_subj") / pl.col("n_subj_pop") * 100))
+    )
 
-    # Stack
-    df_obs = pl.concat(all_levels_df, how="diagonal")
+    # The ID check and the summary are independent; run them together so Polars can
+    # execute both plans in parallel and share the common observation scan
+    missing_ids, df_obs = pl.collect_all(
+        [missing_ids_lf, df_obs_lf],
+        engine="streaming" if total_rows > config.streaming_threshold else "auto",
+    )
 
-    # Calculate percentage
-    df_obs = df_obs.with_columns(pct_subj=(pl.col("n_subj") / pl.col("n_subj_pop") * 100))
+    if missing_ids.height > 0:
+        raise ValueError(
+            f"Some '{id}' values in the observation DataFrame are not present in the population: "
+            f"{missing_ids.get_column(id).to_list()}"
+        )
 
     return df_obs
 
@@ -193,67 +219,56 @@ def format_summary_table(
     else:
         variables = variable
 
-    df_fmt = df.with_columns(
-        pct_subj_fmt=(
-            pl.when(pl.col("pct_subj").is_null() | pl.col("pct_subj").is_nan())
-            .then(0.0)
-            .otherwise(pl.col("pct_subj"))
-            .round(pct_digit, mode="half_away_from_zero")
-            .cast(pl.String)
-        )
-    )
-
     if max_n_width is None:
-        max_n_width = df_fmt.select(pl.col("n_subj").cast(pl.String).str.len_chars().max()).item()
+        # Digit count of the largest count; avoids casting every n_subj to a string
+        n_max = df.select(pl.col("n_subj").max()).item()
+        max_n_width = 1 if n_max is None else len(str(n_max))
 
     max_pct_width = 3 if pct_digit == 0 else 4 + pct_digit
 
-    df_fmt = df_fmt.with_columns(
-        [
-            pl.col("pct_subj_fmt").str.pad_start(max_pct_width, " "),
-            pl.col("n_subj").cast(pl.String).str.pad_start(max_n_width, " ").alias("n_subj_fmt"),
-        ]
-    ).with_columns(
-        n_pct_subj_fmt=pl.concat_str(
-            [pl.col("n_subj_fmt"), pl.lit(" ("), pl.col("pct_subj_fmt"), pl.lit(")")]
-        )
+    # Build all display strings in a single with_columns so the shared
+    # sub-expressions are evaluated once
+    pct_subj_fmt = (
+        pl.when(pl.col("pct_subj").is_null() | pl.col("pct_subj").is_nan())
+        .then(0.0)
+        .otherwise(pl.col("pct_subj"))
+        .round(pct_digit, mode="half_away_from_zero")
+        .cast(pl.String)
+        .str.pad_start(max_pct_width, " ")
+    )
+    n_subj_fmt = pl.col("n_subj").cast(pl.String).str.pad_start(max_n_width, " ")
+
+    df_fmt = df.with_columns(
+        pct_subj_fmt.alias("pct_subj_fmt"),
+        n_subj_fmt.alias("n_subj_fmt"),
+        pl.format("{} ({})", n_subj_fmt, pct_subj_fmt).alias("n_pct_subj_fmt"),
     )
 
     # Sorting Logic
     sort_exprs = [pl.col(group)]
     for var in variables:
         # 0 for __all__, 1 for values, 2 for config.missing_str
-        sort_key_col = f"__sort_key_{var}__"
-        df_fmt = df_fmt.with_columns(
-            pl.when(pl.col(var) == "__all__")
-            .then(0)
-            .when(pl.col(var) == config.missing_str)
-            .then(2)
-            .otherwise(1)
-            .alias(sort_key_col)
+        sort_exprs.append(
+            pl.col(var).replace_strict(
+                {"__all__": 0, config.missing_str: 2}, default=1, return_dtype=pl.UInt8
+            )
         )
-        sort_exprs.append(pl.col(sort_key_col))
         sort_exprs.append(pl.col(var))
 
-    df_fmt = df_fmt.sort(sort_exprs).select(pl.exclude(r"^__sort_key_.*$"))
+    df_fmt = df_fmt.sort(sort_exprs)
 
-    # Indentation logic
+    # Indentation logic: the deepest variable that is not "__all__" provides the label,
+    # indented by 4 spaces per hierarchy level
     if len(variables) > 0:
-        var_expr = (
-            pl.when(pl.col(variables[0]) == config.missing_str)
-            .then(pl.lit("Missing"))
-            .otherwise(pl.col(variables[0]))
+        levels = list(enumerate(variables))[::-1]
+        indent = pl.coalesce(
+            [pl.when(pl.col(var) != "__all__").then(pl.lit(" " * 4 * i)) for i, var in levels]
         )
-
-        for i in range(1, len(variables)):
-            var_expr = (
-                pl.when(pl.col(variables[i]) == "__all__")
-                .then(var_expr)
-                .when(pl.col(variables[i]) == config.missing_str)
-                .then(pl.lit(" " * 4 * i) + pl.lit("Missing"))
-                .otherwise(pl.lit(" " * 4 * i) + pl.col(variables[i]))
-            )
-        df_fmt = df_fmt.with_columns(var_expr.alias("__variable__"))
+        label = pl.coalesce(
+            [pl.when(pl.col(var) != "__all__").then(pl.col(var)) for _, var in levels]
+        )
+        label = pl.when(label == config.missing_str).then(pl.lit("Missing")).otherwise(label)
+        df_fmt = df_fmt.with_columns(pl.concat_str([indent, label]).alias("__variable__"))
 
     df_fmt = df_fmt.with_row_index(name="__id__", offset=1)
     return df_fmt
@@ -12,6 +12,7 @@ from typing import Any
 import polars as pl
 
 from .plan import StudyPlan
+from .utils import sql_expr
 
 
 def parse_filter_to_sql(filter_str: str) -> str:
@@ -72,7 +73,7 @@ def apply_filter_sql(df: pl.DataFrame, filter_str: str) -> pl.DataFrame:
 
     try:
         # Use pl.sql_expr() - much simpler and faster!
-        return df.filter(pl.sql_expr(where_clause))
+        return df.filter(sql_expr(where_clause))
     except Exception as e:
         # Fallback to manual parsing if SQL fails
         print(f"Warning: SQL filter failed ({e}), using fallback method")
@@ -7,12 +7,27 @@ using YAML plans with template inheritance and keyword resolution.
 
 import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import polars as pl
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
+from .config import config
 from .yaml_loader import YamlInheritanceLoader
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -25,6 +40,9 @@ class Keyword(BaseModel):
     label: Optional[str] = None
     description: Optional[str] = None
 
+    # Keywords are read-only once loaded from the plan
+    model_config = ConfigDict(frozen=True)
+
 
 class Population(Keyword):
     """Population definition with filter."""
@@ -74,9 +92,9 @@ class DataSource(BaseModel):
 
     name: str
     path: str
-    dataframe: Optional[pl.DataFrame] = Field(default=None, exclude=True)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Loaded frames live in StudyPlan.datasets, keeping the definition read-only
+    model_config = ConfigDict(frozen=True)
 
 
 class AnalysisPlan(BaseModel):
@@ -91,12 +109,22 @@ class AnalysisPlan(BaseModel):
     @property
     def id(self) -> str:
         """Generate unique analysis ID."""
-        parts = [self.analysis, self.population]
-        if self.observation:
-            parts.append(self.observation)
-        if self.parameter:
-            parts.append(self.parameter)
-        return "_".join(parts)
+        return (
+            f"{self.analysis}_{self.population}"
+            + (f"_{self.observation}" if self.observation else "")
+            + (f"_{self.parameter}" if self.parameter else "")
+        )
+
+
+# Validate expanded plan values as AnalysisPlan would, without building one per combination
+_NAME = TypeAdapter(str)
+_OPTIONAL_NAME = TypeAdapter(Optional[str])
+_NAMES = TypeAdapter(List[str])
+_OPTIONAL_NAMES = TypeAdapter(List[Optional[str]])
+
+
+# Models registered by their name in a KeywordRegistry
+_NamedModel = TypeVar("_NamedModel", bound=Union[Keyword, DataSource])
 
 
 class KeywordRegistry(BaseModel):
@@ -113,18 +141,13 @@ class KeywordRegistry(BaseModel):
         # We manually load so we can handle the dict-to-list-of-models transformation
         # and the specific logic for defaults.
 
-        for item in data.get("population", []):
-            pop_item = Population(**item)
-            self.populations[pop_item.name] = pop_item
-
-        for item in data.get("observation", []):
-            obs_item = Observation(**item)
-            self.observations[obs_item.name] = obs_item
-
-        for item in data.get("parameter", []):
-            param_item = Parameter(**item)
-            self.parameters[param_item.name] = param_item
+        # Sections whose items map directly onto a model keyed by name
+        self._load_items(data.get("population", []), Population, self.populations)
+        self._load_items(data.get("observation", []), Observation, self.observations)
+        self._load_items(data.get("parameter", []), Parameter, self.parameters)
+        self._load_items(data.get("data", []), DataSource, self.data_sources)
 
+        groups: List[Group] = []
         for item in data.get("group", []):
             # Special handling for Group where 'label' might be a list (for group_label)
             # but Keyword.label expects a string.
@@ -135,12 +158,16 @@ class KeywordRegistry(BaseModel):
                 # or set it to a joined string if a label is really needed
                 del item["label"]
 
-            group_item = Group(**item)
-            self.groups[group_item.name] = group_item
+            groups.append(Group(**item))
+        self.groups.update((group.name, group) for group in groups)
 
-        for item in data.get("data", []):
-            ds_item = DataSource(**item)
-            self.data_sources[ds_item.name] = ds_item
+    @staticmethod
+    def _load_items(
+        items: List[Dict[str, Any]], model: Type[_NamedModel], registry: Dict[str, _NamedModel]
+    ) -> None:
+        # Validate every item first, then register them in one bulk update
+        keywords = [model(**item) for item in items]
+        registry.update((keyword.name, keyword) for keyword in keywords)
 
     def get_population(self, name: str) -> Optional[Population]:
         return self.populations.get(name)
@@ -166,20 +193,55 @@ class PlanExpander:
 
     def expand_plan(self, plan_data: Dict[str, Any]) -> List[AnalysisPlan]:
         """Expand a single condensed plan into individual plans."""
-        analysis = plan_data["analysis"]
-        populations = self._to_list(plan_data.get("population", []))
-        observations: List[Any] = self._to_list(plan_data.get("observation")) or [None]
-        parameters: List[Any] = self._parse_parameters(plan_data.get("parameter")) or [None]
-        group = plan_data.get("group")
+        analysis = _NAME.validate_python(plan_data["analysis"])
+        group = _OPTIONAL_NAME.validate_python(plan_data.get("group"))
 
+        # Every field is already validated, so the plans are built without validating again
         expanded_plans = [
-            AnalysisPlan(
+            AnalysisPlan.model_construct(
                 analysis=analysis, population=pop, observation=obs, group=group, parameter=param
             )
-            for pop, obs, param in itertools.product(populations, observations, parameters)
+            for pop, obs, param in self._combinations(plan_data)
         ]
         return expanded_plans
 
+    def expand_columns(self, plan_data: Dict[str, Any], columns: Dict[str, List[Any]]) -> None:
+        """Append the expansion of a condensed plan to per-field column lists.
+
+        Equivalent to ``expand_plan`` but avoids building an AnalysisPlan per combination.
+        """
+        analysis = _NAME.validate_python(plan_data["analysis"])
+        group = _OPTIONAL_NAME.validate_python(plan_data.get("group"))
+
+        for pop, obs, param in self._combinations(plan_data):
+            columns["analysis"].append(analysis)
+            columns["population"].append(pop)
+            columns["observation"].append(obs)
+            columns["parameter"].append(param)
+            columns["group"].append(group)
+
+    def count_plan(self, plan_data: Dict[str, Any]) -> int:
+        """Count the individual plans a condensed plan expands to, without expanding it."""
+        populations, observations, parameters = self._axes(plan_data)
+        return len(populations) * len(observations) * len(parameters)
+
+    def _combinations(
+        self, plan_data: Dict[str, Any]
+    ) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        # Validated once per axis value rather than once per combination
+        populations, observations, parameters = self._axes(plan_data)
+        return itertools.product(
+            _NAMES.validate_python(populations),
+            _OPTIONAL_NAMES.validate_python(observations),
+            _OPTIONAL_NAMES.validate_python(parameters),
+        )
+
+    def _axes(self, plan_data: Dict[str, Any]) -> Tuple[List[Any], List[Any], List[Any]]:
+        populations = self._to_list(plan_data.get("population", []))
+        observations: List[Any] = self._to_list(plan_data.get("observation")) or [None]
+        parameters: List[Any] = self._parse_parameters(plan_data.get("parameter")) or [None]
+        return populations, observations, parameters
+
     def create_analysis_spec(self, plan: AnalysisPlan) -> Dict[str, Any]:
         """Create a summary analysis specification with keywords."""
         spec = {
@@ -206,18 +268,69 @@ class PlanExpander:
         return list(value)
 
     def _generate_title(self, plan: AnalysisPlan) -> str:
-        parts = [plan.analysis.replace("_", " ").title()]
+        title = plan.analysis.replace("_", " ").title()
         if (pop := self.keywords.get_population(plan.population)) and pop.label:
-            parts.append(f"- {pop.label}")
-        if plan.observation:
-            obs = self.keywords.get_observation(plan.observation)
-            if obs and obs.label:
-                parts.append(f"- {obs.label}")
-        if plan.parameter:
-            param = self.keywords.get_parameter(plan.parameter)
-            if param and param.label:
-                parts.append(f"- {param.label}")
-        return " ".join(parts)
+            title = f"{title} - {pop.label}"
+        if plan.observation and (obs := self.keywords.get_observation(plan.observation)):
+            if obs.label:
+                title = f"{title} - {obs.label}"
+        if plan.parameter and (param := self.keywords.get_parameter(plan.parameter)):
+            if param.label:
+                title = f"{title} - {param.label}"
+        return title
+
+
+class _LazyDatasets(Dict[str, pl.DataFrame]):
+    """Datasets of a study plan, read from their data source on first access.
+
+    A data source that fails to read is remembered and not retried. Membership reflects the
+    datasets that can be read; iteration and length only cover those read so far.
+    """
+
+    def __init__(
+        self,
+        data_sources: Dict[str, DataSource],
+        reader: Callable[[DataSource], Optional[pl.DataFrame]],
+    ) -> None:
+        super().__init__()
+        self._data_sources = data_sources
+        self._reader = reader
+        self._failed: Set[str] = set()
+
+    def __missing__(self, name: str) -> pl.DataFrame:
+        data_source = self._data_sources.get(name)
+        if data_source is None or name in self._failed:
+            raise KeyError(name)
+        self._store(name, self._reader(data_source))
+        return self[name]
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.get(name) is not None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def load_all(self) -> None:
+        """Read every data source that has not been read yet."""
+        pending = [
+            name
+            for name in self._data_sources
+            if name not in self.keys() and name not in self._failed
+        ]
+        # Parquet reads release the GIL, so reading on worker threads overlaps the files
+        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+            frames = list(executor.map(self._reader, (self._data_sources[n] for n in pending)))
+        for name, df in zip(pending, frames):
+            self._store(name, df)
+
+    def _store(self, name: str, df: Optional[pl.DataFrame]) -> None:
+        if df is None:
+            self._failed.add(name)
+        else:
+            self[name] = df
 
 
 class StudyPlan:
@@ -226,11 +339,11 @@ class StudyPlan:
     def __init__(self, study_data: Dict[str, Any], base_path: Optional[Path] = None) -> None:
         self.study_data = study_data
         self.base_path: Path = base_path or Path(".")
-        self.datasets: Dict[str, pl.DataFrame] = {}
         self.keywords = KeywordRegistry()
         self.expander = PlanExpander(self.keywords)
         self.keywords.load_from_dict(self.study_data)
-        self.load_datasets()
+        # Datasets are read on first use; call load_datasets() to read them all up front
+        self.datasets = _LazyDatasets(self.keywords.data_sources, self._read_dataset)
 
     @property
     def output_dir(self) -> str:
@@ -239,87 +352,100 @@ class StudyPlan:
         return cast(str, study_config.get("output", "."))
 
     def load_datasets(self) -> None:
-        """Load datasets from paths specified in data_sources."""
-        for name, data_source in self.keywords.data_sources.items():
-            try:
-                # Ensure the path is relative to the base_path of the plan
-                path = self.base_path / data_source.path
-                df = pl.read_parquet(path)
-                self.datasets[name] = df
-                data_source.dataframe = df
-                logger.info(f"Successfully loaded dataset '{name}' from '{path}'")
-            except Exception as e:
-                logger.warning(
-                    f"Could not load dataset '{name}' from '{data_source.path}'. Reason: {e}"
-                )
+        """Load datasets from paths specified in data_sources that are not read yet."""
+        self.datasets.load_all()
+
+    def _read_dataset(self, data_source: DataSource) -> Optional[pl.DataFrame]:
+        try:
+            # Ensure the path is relative to the base_path of the plan
+            path = self.base_path / data_source.path
+            df = pl.read_parquet(path)
+            logger.info(f"Successfully loaded dataset '{data_source.name}' from '{path}'")
+            return df
+        except Exception as e:
+            logger.warning(
+                f"Could not load dataset '{data_source.name}' from '{data_source.path}'. "
+                f"Reason: {e}"
+            )
+            return None
 
     def get_plan_df(self) -> pl.DataFrame:
         """Expand all condensed plans into a DataFrame of detailed specifications."""
-        all_specs = [
-            self.expander.create_analysis_spec(plan)
-            for plan_data in self.study_data.get("plans", [])
-            for plan in self.expander.expand_plan(plan_data)
-        ]
-        return pl.DataFrame(all_specs)
+        columns: Dict[str, List[Any]] = {
+            "analysis": [],
+            "population": [],
+            "observation": [],
+            "parameter": [],
+            "group": [],
+        }
+        for plan_data in self.study_data.get("plans", []):
+            self.expander.expand_columns(plan_data, columns)
+        return pl.DataFrame(columns)
 
     def get_dataset_df(self) -> Optional[pl.DataFrame]:
         """Get a DataFrame of data sources."""
-        if not self.keywords.data_sources:
+        data_sources = self.keywords.data_sources
+        if not data_sources:
             return None
         return pl.DataFrame(
-            [
-                {"name": name, "path": ds.path, "loaded": name in self.datasets}
-                for name, ds in self.keywords.data_sources.items()
-            ]
+            {
+                "name": list(data_sources),
+                "path": [ds.path for ds in data_sources.values()],
+                "loaded": [name in self.datasets for name in data_sources],
+            }
         )
 
     def get_population_df(self) -> Optional[pl.DataFrame]:
         """Get a DataFrame of analysis populations."""
-        if not self.keywords.populations:
+        populations = self.keywords.populations
+        if not populations:
             return None
         return pl.DataFrame(
-            [
-                {"name": name, "label": pop.label, "filter": pop.filter}
-                for name, pop in self.keywords.populations.items()
-            ]
+            {
+                "name": list(populations),
+                "label": [pop.label for pop in populations.values()],
+                "filter": [pop.filter for pop in populations.values()],
+            }
         )
 
     def get_observation_df(self) -> Optional[pl.DataFrame]:
         """Get a DataFrame of analysis observations."""
-        if not self.keywords.observations:
+        observations = self.keywords.observations
+        if not observations:
             return None
         return pl.DataFrame(
-            [
-                {"name": name, "label": obs.label, "filter": obs.filter}
-                for name, obs in self.keywords.observations.items()
-            ]
+            {
+                "name": list(observations),
+                "label": [obs.label for obs in observations.values()],
+                "filter": [obs.filter for obs in observations.values()],
+            }
         )
 
     def get_parameter_df(self) -> Optional[pl.DataFrame]:
         """Get a DataFrame of analysis parameters."""
-        if not self.keywords.parameters:
+        parameters = self.keywords.parameters
+        if not parameters:
             return None
         return pl.DataFrame(
-            [
-                {"name": name, "label": param.label, "filter": param.filter}
-                for name, param in self.keywords.parameters.items()
-            ]
+            {
+                "name": list(parameters),
+                "label": [param.label for param in parameters.values()],
+                "filter": [param.filter for param in parameters.values()],
+            }
         )
 
     def get_group_df(self) -> Optional[pl.DataFrame]:
         """Get a DataFrame of analysis groups."""
-        if not self.keywords.groups:
+        groups = self.keywords.groups
+        if not groups:
             return None
         return pl.DataFrame(
-            [
-                {
-                    "name": name,
-                    "variable": group.variable,
-                    "levels": str(group.level),
-                    "labels": str(group.group_label),
-                }
-                for name, group in self.keywords.groups.items()
-            ]
+            {
+                "name": list(groups),
+                "variable": [group.variable for group in groups.values()],
+                "levels": [str(group.level) for group in groups.values()],
+                "labels": [str(group.group_label) for group in groups.values()],
+            }
         )
 
     def print(self) -> None:
@@ -347,7 +473,9 @@ class StudyPlan:
     def __str__(self) -> str:
         study_name = self.study_data.get("study", {}).get("name", "Unknown")
         condensed_plans = len(self.study_data.get("plans", []))
-        individual_analyses = len(self.get_plan_df())
+        individual_analyses = sum(
+            self.expander.count_plan(plan_data) for plan_data in self.study_data.get("plans", [])
+        )
         return (
             f"StudyPlan(study='{study_name}', plans={condensed_plans}, "
             f"analyses={individual_analyses})"
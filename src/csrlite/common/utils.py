@@ -1,33 +1,51 @@
 # pyre-strict
+from functools import lru_cache
+from typing import TypeVar
+
 import polars as pl
 
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+
+@lru_cache(maxsize=256)
+def sql_expr(sql: str) -> pl.Expr:
+    """
+    Parse a SQL WHERE clause into a Polars expression, caching the result.
+
+    Filters from a StudyPlan are reused across many analyses; expressions are
+    immutable, so the parsed expression can be shared safely.
+    """
+    return pl.sql_expr(sql)
+
 
 def apply_common_filters(
     population: pl.DataFrame,
-    observation: pl.DataFrame | None,
+    observation: FrameT | None,
     population_filter: str | None,
     observation_filter: str | None,
     parameter_filter: str | None = None,
-) -> tuple[pl.DataFrame, pl.DataFrame | None]:
+) -> tuple[pl.DataFrame, FrameT | None]:
     """
     Apply standard population, observation, and parameter filters.
 
+    The observation may be a LazyFrame, in which case the filters are added to its
+    query plan and it is returned lazy.
+
     Returns:
         Tuple of (filtered_population, filtered_observation_pre_id_match)
     """
     # Apply population filter
     if population_filter:
-        population_filtered = population.filter(pl.sql_expr(population_filter))
+        population_filtered = population.filter(sql_expr(population_filter))
     else:
         population_filtered = population
 
-    # Apply observation filter
+    # Apply observation and parameter filters as a single fused predicate
     observation_filtered = observation
-    if observation_filter and observation_filtered is not None:
-        observation_filtered = observation_filtered.filter(pl.sql_expr(observation_filter))
-
-    # Apply parameter filter
-    if parameter_filter and observation_filtered is not None:
-        observation_filtered = observation_filtered.filter(pl.sql_expr(parameter_filter))
+    observation_predicates = [sql_expr(f) for f in (observation_filter, parameter_filter) if f]
+    if observation_predicates and observation_filtered is not None:
+        observation_filtered = observation_filtered.filter(
+            pl.all_horizontal(observation_predicates)
+        )
 
     return population_filtered, observation_filtered
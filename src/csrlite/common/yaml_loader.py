@@ -1,10 +1,25 @@
 # pyre-strict
+from collections import deque
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 import yaml
 
+# Parse with the libyaml C extension when PyYAML was built against it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml(text: str) -> Dict[str, Any]:
+    # Keyed on the file content, so an edited file is parsed again. Callers must
+    # not mutate the cached result.
+    return yaml.load(text, Loader=SafeLoader) or {}
+
 
 class YamlInheritanceLoader:
     def __init__(self, base_path: Optional[Path] = None) -> None:
@@ -15,11 +30,16 @@ class YamlInheritanceLoader:
         Load a YAML file by name relative to base_path and resolve inheritance.
         """
         file_path = self.base_path / file_name
-        if not file_path.exists():
-            raise FileNotFoundError(f"YAML file not found: {file_path}")
+        # Let open() detect a missing file instead of a separate exists() check
+        try:
+            with open(file_path, "r") as f:
+                text = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"YAML file not found: {file_path}") from None
 
-        with open(file_path, "r") as f:
-            data = yaml.safe_load(f) or {}
+        # Templates shared by several plans are parsed only once; hand out a copy
+        # since the merged data is modified downstream
+        data = deepcopy(_parse_yaml(text))
 
         return self._resolve_inheritance(data)
 
@@ -39,33 +59,54 @@ class YamlInheritanceLoader:
         return self._deep_merge(merged_template_data, data)
 
     def _deep_merge(self, dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
+        # Copy the base once and merge into it in place; nested dicts and keyword entries
+        # are queued instead of recursed into. The queue is first-in first-out so repeated
+        # merges into the same target are applied in document order.
         merged = deepcopy(dict1)
-        for key, value in dict2.items():
-            if key in merged and isinstance(merged[key], list) and isinstance(value, list):
-                # Heuristic to check if these are lists of keywords (dicts with a 'name')
-                # This logic is specific to how this project uses YAML inheritance.
-                is_keyword_list = all(isinstance(i, dict) and "name" in i for i in value) and all(
-                    isinstance(i, dict) and "name" in i for i in merged[key]
-                )
-
-                if is_keyword_list:
-                    merged_by_name = {item["name"]: item for item in merged[key]}
-                    for item in value:
-                        if item["name"] in merged_by_name:
-                            # It's a dict merge, so we can recursively call _deep_merge
-                            merged_by_name[item["name"]] = self._deep_merge(
-                                merged_by_name[item["name"]], item
-                            )
-                        else:
-                            merged_by_name[item["name"]] = item
-                    merged[key] = list(merged_by_name.values())
+        pending = deque([(merged, dict2)])
+
+        # Values taken over from dict2 by reference; they are copied before anything is
+        # merged into them so the input is never modified
+        borrowed: Set[int] = set()
+
+        while pending:
+            target, source = pending.popleft()
+            for key, value in source.items():
+                current = target.get(key)
+                if key in target and isinstance(current, list) and isinstance(value, list):
+                    # Heuristic to check if these are lists of keywords (dicts with a 'name')
+                    # This logic is specific to how this project uses YAML inheritance.
+                    is_keyword_list = all(
+                        isinstance(i, dict) and "name" in i for i in value
+                    ) and all(isinstance(i, dict) and "name" in i for i in current)
+
+                    if id(current) in borrowed:
+                        current = target[key] = deepcopy(current)
+
+                    if is_keyword_list:
+                        merged_by_name = {item["name"]: item for item in current}
+                        for item in value:
+                            existing = merged_by_name.get(item["name"])
+                            if existing is None:
+                                merged_by_name[item["name"]] = item
+                                borrowed.add(id(item))
+                                continue
+                            if id(existing) in borrowed:
+                                existing = merged_by_name[item["name"]] = deepcopy(existing)
+                            # Merge the keyword definitions key by key
+                            pending.append((existing, item))
+                        target[key] = list(merged_by_name.values())
+                    else:
+                        # Fallback for simple lists: concatenate and remove duplicates
+                        # Note: This is a simple approach and might not be suitable for all
+                        # list types.
+                        current.extend([item for item in value if item not in current])
+
+                elif key in target and isinstance(current, dict) and isinstance(value, dict):
+                    if id(current) in borrowed:
+                        current = target[key] = deepcopy(current)
+                    pending.append((current, value))
                 else:
-                    # Fallback for simple lists: concatenate and remove duplicates
-                    # Note: This is a simple approach and might not be suitable for all list types.
-                    merged[key].extend([item for item in value if item not in merged[key]])
-
-            elif key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = self._deep_merge(merged[key], value)
-            else:
-                merged[key] = value
+                    target[key] = value
+                    borrowed.add(id(value))
         return merged
@@ -45,7 +45,8 @@ def study_plan_to_disposition_summary(
     missing_group = "error"
 
     # Create output directory
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     # Initialize parser
     parser = StudyPlanParser(study_plan)
@@ -87,7 +88,7 @@ def study_plan_to_disposition_summary(
         # Build output filename
         group_suffix = f"_{group}" if group else ""
         filename = f"{analysis_type}_{population}{group_suffix}.rtf"
-        output_file = str(Path(output_dir) / filename)
+        output_file = str(out_dir / filename)
 
         rtf_path = disposition(
             population=population_df,
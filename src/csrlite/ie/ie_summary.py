@@ -10,7 +10,6 @@ This module provides a pipeline for IE summary analysis:
 """
 
 from pathlib import Path
-from typing import Any
 
 import polars as pl
 
@@ -58,6 +57,10 @@ def study_plan_to_ie_summary(
 
     generated_files = []
 
+    # ADSL and ADIE are the same for every IE analysis; load them once on first use
+    adsl_raw: pl.DataFrame | None = None
+    adie: pl.DataFrame | None = None
+
     # Iterate over analyses
     for analysis in ie_plans.iter_rows(named=True):
         # Load data
@@ -74,7 +77,8 @@ def study_plan_to_ie_summary(
             else:
                 # Load Filtered Population (ADSL) without Group
                 # Manual load + filter since get_population_data requires group
-                (adsl_raw,) = parser.get_datasets("adsl")
+                if adsl_raw is None:
+                    (adsl_raw,) = parser.get_datasets("adsl")
                 pop_filter = parser.get_population_filter(pop_name)
 
                 adsl, _ = apply_common_filters(
@@ -93,7 +97,8 @@ def study_plan_to_ie_summary(
 
         # Load ADIE
         try:
-            (adie,) = parser.get_datasets(criteria_df_name)
+            if adie is None:
+                (adie,) = parser.get_datasets(criteria_df_name)
         except ValueError as e:
             print(f"Error loading datasets: {e}")
             continue
@@ -132,7 +137,9 @@ def ie_ard(adsl: pl.DataFrame, adie: pl.DataFrame, group_col: str | None = None)
 
     # 1. Prepare Data
     # Join ADIE to ADSL to get treatment group info
-    df_joined: pl.DataFrame = adie.join(
+    # Only the criteria columns are carried into the join; the group always comes from ADSL,
+    # even when ADIE has its own copy of the group column
+    df_joined: pl.DataFrame = adie.select("USUBJID", "PARAMCAT", "PARAM").join(
         adsl.select(["USUBJID"] + ([group_col] if group_col else [])), on="USUBJID", how="inner"
     )
 
@@ -140,9 +147,6 @@ def ie_ard(adsl: pl.DataFrame, adie: pl.DataFrame, group_col: str | None = None)
         # Add dummy Total column
         df_joined = df_joined.with_columns(pl.lit("Total").alias("Total"))
 
-    # Define hierarchy
-    results: list[dict[str, Any]] = []
-
     # Get distinct groups
     groups: list[str]
     if group_col:
@@ -161,61 +165,81 @@ def ie_ard(adsl: pl.DataFrame, adie: pl.DataFrame, group_col: str | None = None)
         pl.col("USUBJID").n_unique().alias("count")
     )
 
-    total_failures_map: dict[str, int] = {
-        row[actual_group_col]: row["count"] for row in total_failures_by_group.iter_rows(named=True)
-    }
-
-    # Helper for row generation
-    def add_row(
-        label: str, filter_expr: pl.Expr | None = None, is_header: bool = False, indent: int = 0
-    ) -> None:
-        row_data: dict[str, Any] = {"label": label, "indent": indent, "is_header": is_header}
-
-        for g in groups:
-            # Filter data for this group
-            g_df = df_joined.filter(pl.col(actual_group_col) == g)
-
-            if filter_expr is not None:
-                # Filter specific criteria
-                g_df = g_df.filter(filter_expr)
-
-            n = g_df.select("USUBJID").n_unique()
-
-            # Pct based on total failures in that group?
-            denom = total_failures_map.get(g, 0)
-            pct = (n / denom * 100) if denom > 0 else 0.0
-
-            row_data[f"count_{g}"] = n
-            row_data[f"pct_{g}"] = pct
+    total_failures_map: dict[str, int] = dict(
+        zip(
+            total_failures_by_group[actual_group_col].to_list(),
+            total_failures_by_group["count"].to_list(),
+        )
+    )
 
-        results.append(row_data)
+    # Row specifications: (label, filter_expr, is_header, indent)
+    specs: list[tuple[str, pl.Expr | None, bool, int]] = []
 
     # 1. Total Screening Failures
-    add_row("Total Screening Failures")
+    specs.append(("Total Screening Failures", None, False, 0))
 
     # 2. Exclusion Criteria Met
     excl_expr = pl.col("PARAMCAT") == "EXCLUSION CRITERIA MET"
-    add_row("Exclusion Criteria Met", excl_expr, is_header=True, indent=1)
+    specs.append(("Exclusion Criteria Met", excl_expr, True, 1))
 
     # Details for Exclusion
     excl_params = (
         df_joined.filter(excl_expr).select("PARAM").unique().sort("PARAM").to_series().to_list()
     )
     for param in excl_params:
-        add_row(param, excl_expr & (pl.col("PARAM") == param), indent=2)
+        specs.append((param, excl_expr & (pl.col("PARAM") == param), False, 2))
 
     # 3. Inclusion Criteria Not Met
     incl_expr = pl.col("PARAMCAT") == "INCLUSION CRITERIA NOT MET"
-    add_row("Inclusion Criteria Not Met", incl_expr, is_header=True, indent=1)
+    specs.append(("Inclusion Criteria Not Met", incl_expr, True, 1))
 
     # Details for Inclusion
     incl_params = (
         df_joined.filter(incl_expr).select("PARAM").unique().sort("PARAM").to_series().to_list()
     )
     for param in incl_params:
-        add_row(param, incl_expr & (pl.col("PARAM") == param), indent=2)
+        specs.append((param, incl_expr & (pl.col("PARAM") == param), False, 2))
+
+    # Count subjects for every row and group in one query (long format), then pivot so
+    # groups become columns instead of filtering once per (row, group) pair
+    joined_lf = df_joined.lazy().filter(pl.col(actual_group_col).is_in(groups))
+    counts_long = pl.concat(
+        [
+            (joined_lf if filter_expr is None else joined_lf.filter(filter_expr))
+            .group_by(actual_group_col)
+            .agg(pl.col("USUBJID").n_unique().alias("count"))
+            .with_columns(pl.lit(i, dtype=pl.UInt32).alias("__row__"))
+            for i, (_, filter_expr, _, _) in enumerate(specs)
+        ]
+    ).collect()
+
+    counts_wide = counts_long.pivot(on=actual_group_col, index="__row__", values="count")
+
+    rows = pl.DataFrame(
+        {
+            "__row__": range(len(specs)),
+            "label": [label for label, _, _, _ in specs],
+            "indent": [indent for _, _, _, indent in specs],
+            "is_header": [is_header for _, _, is_header, _ in specs],
+        },
+        schema_overrides={"__row__": pl.UInt32},
+    ).join(counts_wide, on="__row__", how="left")
+
+    # Pct based on total failures in that group. The denominators are added as real
+    # columns: dividing by a literal makes Polars multiply by its reciprocal, which can
+    # land an ulp off n / denom * 100 and flip a .5 tie when the percentage is displayed
+    rows = rows.with_columns(
+        pl.Series(f"__denom_{g}", [total_failures_map.get(g, 0)] * rows.height) for g in groups
+    )
+    group_exprs: list[pl.Expr] = []
+    for g in groups:
+        n = pl.col(str(g)) if str(g) in counts_wide.columns else pl.lit(0)
+        n = n.fill_null(0).cast(pl.Int64)
+        denom = total_failures_map.get(g, 0)
+        pct = n / pl.col(f"__denom_{g}") * 100 if denom > 0 else pl.lit(0.0)
+        group_exprs.extend([n.alias(f"count_{g}"), pct.alias(f"pct_{g}")])
 
-    return pl.DataFrame(results)
+    return rows.sort("__row__").select("label", "indent", "is_header", *group_exprs)
 
 
 def ie_df(ard: pl.DataFrame) -> pl.DataFrame:
@@ -243,17 +267,13 @@ def ie_df(ard: pl.DataFrame) -> pl.DataFrame:
         # format: "{n} ({pct:.1f})"
 
         # Note: Polars doesn't have f-string strictly in expressions like python
-        # We use strict casting and concatenation
+        # We use native rounding and pl.format (no per-row Python UDF)
 
         col_n = pl.col(f"count_{g}")
         col_pct = pl.col(f"pct_{g}")
 
-        fmt = (
-            col_n.cast(pl.Utf8)
-            + " ("
-            + col_pct.map_elements(lambda x: f"{x:.1f}", return_dtype=pl.Utf8)
-            + ")"
-        ).alias(g)
+        # round() rounds ties to even, matching the f"{pct:.1f}" formatting of the cell
+        fmt = pl.format("{} ({})", col_n, col_pct.round(1).cast(pl.Utf8)).alias(g)
 
         select_exprs.append(fmt)
 
@@ -57,6 +57,12 @@ def mh_summary(
     return output_file
 
 
+# Pivot column name for subjects whose group is missing
+_NULL_GROUP = "__null__"
+# Join key standing in for the hierarchy values a summary row does not break down by
+_ALL_VALUES = "__all__"
+
+
 def mh_summary_ard(
     population: pl.DataFrame,
     observation: pl.DataFrame,
@@ -99,102 +105,137 @@ def mh_summary_ard(
     # Identify the hierarchy columns
     # If standard usage: variables=[("MHBODSYS", "SOC"), ("MHDECOD", "PT")]
 
-    # We will build a list of (filter_expr, label, indent_level, is_header)
+    # We will build a list of (label, indent_level, is_header) rows, each keyed by its
+    # hierarchy level and the (MHBODSYS, MHDECOD) values it counts
 
     specs: list[dict[str, Any]] = []
 
     # 1. Overall "Any Medical History"
     specs.append(
-        {"filter": pl.lit(True), "label": "Any Medical History", "indent": 0, "is_header": False}
+        {
+            "level": 0,
+            "MHBODSYS": None,
+            "MHDECOD": None,
+            "label": "Any Medical History",
+            "indent": 0,
+            "is_header": False,
+        }
     )
 
-    # Get distinct Body Systems
-    bodsys_list: list[str | None] = (
-        adq.select("MHBODSYS").unique().sort("MHBODSYS").to_series().to_list()
+    # Distinct (Body System, Term) pairs, sorted, in a single pass
+    pairs = (
+        adq.select(pl.col("MHBODSYS", "MHDECOD").cast(pl.String))
+        .filter(pl.col("MHBODSYS").is_not_null())
+        .unique()
+        .sort("MHBODSYS", "MHDECOD")
     )
 
-    for sys in bodsys_list:
-        if sys is None:
-            continue
-
-        # Add Body System Row
-        specs.append(
-            {
-                "filter": pl.col("MHBODSYS") == sys,
-                "label": sys,
-                "indent": 1,
-                "is_header": False,  # It has counts
-            }
-        )
-
-        # Get distinct Terms within this System
-        terms: list[str | None] = (
-            adq.filter(pl.col("MHBODSYS") == sys)
-            .select("MHDECOD")
-            .unique()
-            .sort("MHDECOD")
-            .to_series()
-            .to_list()
-        )
-
-        for term in terms:
-            if term is None:
-                continue
+    current_sys: str | None = None
+    for sys, term in pairs.iter_rows():
+        if sys != current_sys:
+            current_sys = sys
+            # Add Body System Row (it has counts)
             specs.append(
                 {
-                    "filter": (pl.col("MHBODSYS") == sys) & (pl.col("MHDECOD") == term),
-                    "label": term,
-                    "indent": 2,
+                    "level": 1,
+                    "MHBODSYS": sys,
+                    "MHDECOD": None,
+                    "label": sys,
+                    "indent": 1,
                     "is_header": False,
                 }
             )
 
-    # Now calculate counts for each spec
-    results: list[dict[str, Any]] = []
+        if term is None:
+            continue
+        specs.append(
+            {
+                "level": 2,
+                "MHBODSYS": sys,
+                "MHDECOD": term,
+                "label": term,
+                "indent": 2,
+                "is_header": False,
+            }
+        )
 
     # Get total population counts by group
-    pop_counts = adsl.group_by(group_col).count().sort(group_col)
+    pop_counts = adsl.group_by(group_col).agg(pl.len().alias("count")).sort(group_col)
     groups: list[Any] = pop_counts.select(group_col).to_series().to_list()
     # Pre-calculate totals map
-    pop_totals: dict[Any, int] = {
-        row[group_col]: row["count"] for row in pop_counts.iter_rows(named=True)
-    }
-
-    # Helper to calculate row
-    def calc_row(
-        spec: dict[str, Any], obs_data: pl.DataFrame, pop_data: pl.DataFrame
-    ) -> dict[str, Any]:
-        row_res = {"label": spec["label"], "indent": spec["indent"], "is_header": spec["is_header"]}
-
-        # Filter observation data based on spec string/expr
-        # Note: count_subject_with_observation logic handles join.
-        # We can simulate logic here.
-
-        # 1. Filter ADQ based on criteria
-        filtered_obs = obs_data.filter(spec["filter"])
-
-        # 2. Join with ADSL to get groups (inner join to count only subjects in population)
-        # But we already filtered ADSL (population).
-
-        subset = filtered_obs.join(pop_data.select([id_col, group_col]), on=id_col, how="inner")
-
-        # 3. Group by Group Col
-        counts = subset.select(id_col, group_col).unique().group_by(group_col).count()
-        counts_map = {row[group_col]: row["count"] for row in counts.iter_rows(named=True)}
+    pop_totals: dict[Any, int] = dict(zip(groups, pop_counts["count"].to_list()))
+
+    # Count subjects once per hierarchy level instead of once per row: within a level the
+    # rows are disjoint categories, so a single group_by covers all of them
+    # Group keys are pivoted into column names; a null group gets a sentinel name so its
+    # counts survive the pivot instead of landing in a column of nulls
+    group_keys: list[str] = pop_counts[group_col].cast(pl.String).fill_null(_NULL_GROUP).to_list()
+    subset = (
+        adq.lazy()
+        .select(id_col, pl.col("MHBODSYS", "MHDECOD").cast(pl.String))
+        .join(
+            adsl.lazy().select(id_col, pl.col(group_col).cast(pl.String).fill_null(_NULL_GROUP)),
+            on=id_col,
+            how="inner",
+        )
+    )
+    level_keys: list[list[str]] = [[], ["MHBODSYS"], ["MHBODSYS", "MHDECOD"]]
+    counts_long = pl.concat(
+        [
+            subset.group_by(group_col, *keys)
+            .agg(pl.col(id_col).n_unique().alias("count"))
+            .with_columns(pl.lit(level, dtype=pl.Int64).alias("level"))
+            for level, keys in enumerate(level_keys)
+        ],
+        how="diagonal",
+    ).collect()
+
+    # Rows above the term level have no body system or term; a sentinel lets those null
+    # keys match in the join
+    row_keys = [
+        pl.col("level"),
+        pl.col("MHBODSYS").fill_null(_ALL_VALUES),
+        pl.col("MHDECOD").fill_null(_ALL_VALUES),
+    ]
+    counts_wide = counts_long.with_columns(row_keys).pivot(
+        on=group_col, index=["level", "MHBODSYS", "MHDECOD"], values="count"
+    )
 
-        for g in groups:
-            n = counts_map.get(g, 0)
-            denom = pop_totals.get(g, 0)
-            pct = (n / denom * 100.0) if denom > 0 else 0.0
-            row_res[f"count_{g}"] = n
-            row_res[f"pct_{g}"] = pct
+    rows = (
+        pl.DataFrame(
+            specs,
+            schema={
+                "level": pl.Int64,
+                "MHBODSYS": pl.String,
+                "MHDECOD": pl.String,
+                "label": pl.String,
+                "indent": pl.Int64,
+                "is_header": pl.Boolean,
+            },
+        )
+        .with_row_index("__row__")
+        .with_columns(row_keys)
+        .join(counts_wide, on=["level", "MHBODSYS", "MHDECOD"], how="left")
+        .sort("__row__")
+    )
 
-        return row_res
+    # Denominators are added as real columns: dividing by a literal makes Polars multiply
+    # by its reciprocal, which can land an ulp off n / denom * 100 and flip a .5 tie when
+    # the percentage is rounded for display
+    rows = rows.with_columns(
+        pl.Series(f"__denom_{name}", [pop_totals.get(g, 0)] * rows.height)
+        for g, name in zip(groups, group_keys)
+    )
 
-    for spec in specs:
-        results.append(calc_row(spec, adq, adsl))
+    # Groups without subjects in a row get a zero count
+    group_exprs: list[pl.Expr] = []
+    for g, name in zip(groups, group_keys):
+        n = pl.col(name) if name in counts_wide.columns else pl.lit(0)
+        n = n.fill_null(0).cast(pl.Int64)
+        pct = n / pl.col(f"__denom_{name}") * 100.0 if pop_totals.get(g, 0) > 0 else pl.lit(0.0)
+        group_exprs.extend([n.alias(f"count_{g}"), pct.alias(f"pct_{g}")])
 
-    return pl.DataFrame(results)
+    return rows.select("label", "indent", "is_header", *group_exprs)
 
 
 def mh_summary_df(ard: pl.DataFrame) -> pl.DataFrame:
@@ -219,12 +260,8 @@ def mh_summary_df(ard: pl.DataFrame) -> pl.DataFrame:
         col_n = pl.col(f"count_{g}")
         col_pct = pl.col(f"pct_{g}")
 
-        fmt = (
-            col_n.cast(pl.Utf8)
-            + " ("
-            + col_pct.map_elements(lambda x: f"{x:.1f}", return_dtype=pl.Utf8)
-            + ")"
-        ).alias(g)
+        # round() rounds ties to even, matching the f"{pct:.1f}" formatting of the cell
+        fmt = pl.format("{} ({})", col_n, col_pct.round(1).cast(pl.Utf8)).alias(g)
 
         select_exprs.append(fmt)
 
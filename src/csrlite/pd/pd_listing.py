@@ -74,7 +74,7 @@ def pd_listing_ard(
 
     # Filter observation to include only subjects in filtered population
     observation_filtered = observation_to_filter.filter(
-        pl.col(id_var_name).is_in(population_filtered[id_var_name].to_list())
+        pl.col(id_var_name).is_in(population_filtered[id_var_name].implode())
     )
 
     # Determine which observation columns to select
@@ -379,7 +379,8 @@ def study_plan_to_pd_listing(
     group_by = ["USUBJID"]
 
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     # Initialize parser
     parser = StudyPlanParser(study_plan)
@@ -435,7 +436,7 @@ def study_plan_to_pd_listing(
         if observation:
             filename += f"_{observation}"
         filename += ".rtf"
-        output_file = str(Path(output_dir) / filename)
+        output_file = str(out_dir / filename)
 
         # Generate RTF
         rtf_path = pd_listing(
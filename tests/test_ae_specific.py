@@ -77,6 +77,29 @@ class TestAeSpecific(unittest.TestCase):
         # "Headache" -> "Headache"
         # "Nausea" -> "Nausea"
 
+    def test_ae_specific_ard_without_events(self) -> None:
+        ard = ae_specific_ard(
+            population=self.adsl,
+            observation=self.adae,
+            population_filter="SAFFL = 'Y'",
+            observation_filter="AESER = 'Y'",
+            parameter_filter=None,
+            id=self.id,
+            group=self.group,
+            ae_term=self.ae_term,
+            total=True,
+            missing_group="error",
+        ).with_columns(pl.col("__index__").cast(pl.Utf8), pl.col("__group__").cast(pl.Utf8))
+
+        # Only subject 3 (group B) has a serious event
+        without_rows = ard.filter(pl.col("__index__").str.contains("with no"))
+        values = dict(zip(without_rows["__group__"], without_rows["__value__"]))
+        self.assertEqual(values, {"A": "2 (100.0)", "B": "1 ( 50.0)", "Total": "3 ( 75.0)"})
+
+        with_rows = ard.filter(pl.col("__index__").str.contains("with one or more"))
+        values = dict(zip(with_rows["__group__"], with_rows["__value__"]))
+        self.assertEqual(values, {"A": "0 (  0.0)", "B": "1 ( 50.0)", "Total": "1 ( 25.0)"})
+
     def test_ae_specific_df(self) -> None:
         ard = pl.DataFrame(
             {
@@ -91,6 +114,18 @@ class TestAeSpecific(unittest.TestCase):
         self.assertIn("B", df.columns)
         self.assertEqual(df["Term"][0], "Term1")
 
+    def test_ae_specific_df_enum_group_order(self) -> None:
+        ard = pl.DataFrame(
+            {
+                "__index__": ["Term1", "Term1", "Term1"],
+                "__group__": ["A", "Total", "B"],
+                "__value__": ["2", "3", "1"],
+            }
+        ).with_columns(pl.col("__group__").cast(pl.Enum(["B", "A", "Total"])))
+        df = ae_specific_df(ard)
+        self.assertEqual(df.columns, ["Term", "B", "A", "Total"])
+        self.assertEqual(df.row(0), ("Term1", "1", "2", "3"))
+
     @patch("csrlite.ae.ae_specific.create_rtf_table_n_pct")
     def test_ae_specific_rtf(self, mock_create_table: MagicMock) -> None:
         df = pl.DataFrame(
@@ -159,7 +194,7 @@ class TestAeSpecific(unittest.TestCase):
         mock_plan.datasets = {"adsl": self.adsl, "adae": self.adae}
 
         mock_kw_pop = MagicMock()
-        mock_kw_pop.filter = "filter1"
+        mock_kw_pop.filter = "SAFFL = 'Y'"
         mock_kw_pop.label = "Pop Label"
 
         mock_kw_obs = MagicMock()
@@ -187,3 +222,8 @@ class TestAeSpecific(unittest.TestCase):
 
         self.assertEqual(res, ["path/to/output.rtf"])
         mock_ae_specific.assert_called_once()
+
+        # The population is filtered before ae_specific is called
+        kwargs = mock_ae_specific.call_args.kwargs
+        self.assertIsNone(kwargs["population_filter"])
+        self.assertEqual(kwargs["population"].height, 4)
@@ -11,6 +11,7 @@ from csrlite.ae.ae_summary import (
     ae_summary_rtf,
     study_plan_to_ae_summary,
 )
+from csrlite.common.config import config
 
 
 class TestAeSummary(unittest.TestCase):
@@ -70,6 +71,72 @@ class TestAeSummary(unittest.TestCase):
         # Check Total column exists
         self.assertFalse(ard.filter(pl.col("__group__") == "Total").is_empty())
 
+    def test_ae_summary_ard_overlapping_variables(self) -> None:
+        # Subject 1 matches both filters and is counted once under each row
+        variables = [("1=1", "Any AE"), ("AESER = 'Y'", "Serious AE")]
+
+        ard = ae_summary_ard(
+            population=self.adsl,
+            observation=self.adae,
+            population_filter="SAFFL = 'Y'",
+            observation_filter=None,
+            id=self.id,
+            group=self.group,
+            variables=variables,
+            total=True,
+            missing_group="error",
+        )
+
+        val_any = ard.filter((pl.col("__index__") == "Any AE") & (pl.col("__group__") == "A"))
+        val_ser = ard.filter((pl.col("__index__") == "Serious AE") & (pl.col("__group__") == "A"))
+        self.assertEqual(val_any["__value__"].item(), "1 ( 50.0)")
+        self.assertEqual(val_ser["__value__"].item(), "1 ( 50.0)")
+
+        val_total = ard.filter((pl.col("__index__") == "Any AE") & (pl.col("__group__") == "Total"))
+        self.assertEqual(val_total["__value__"].item(), "2 ( 50.0)")
+
+    def test_ae_summary_ard_no_matching_observation(self) -> None:
+        variables = [("AESEV = 'MODERATE'", "Moderate AE")]
+
+        ard = ae_summary_ard(
+            population=self.adsl,
+            observation=self.adae,
+            population_filter="SAFFL = 'Y'",
+            observation_filter=None,
+            id=self.id,
+            group=self.group,
+            variables=variables,
+            total=True,
+            missing_group="error",
+        )
+
+        # Only the population and spacer rows remain
+        self.assertEqual(ard.height, 6)
+        self.assertTrue(ard.filter(pl.col("__index__") == "Moderate AE").is_empty())
+
+    def test_ae_summary_ard_streaming(self) -> None:
+        kwargs = dict(
+            population=self.adsl,
+            observation=self.adae,
+            population_filter="SAFFL = 'Y'",
+            observation_filter=None,
+            id=self.id,
+            group=self.group,
+            variables=[("1=1", "Any AE"), ("AESER = 'Y'", "Serious AE")],
+            total=True,
+            missing_group="error",
+        )
+        expected = ae_summary_ard(**kwargs)
+
+        threshold = config.streaming_threshold
+        config.streaming_threshold = 0
+        try:
+            result = ae_summary_ard(**kwargs)
+        finally:
+            config.streaming_threshold = threshold
+
+        self.assertTrue(result.equals(expected))
+
     def test_ae_summary_df(self) -> None:
         # create a minimal ARD
         ard = pl.DataFrame(
@@ -3,6 +3,7 @@ import unittest
 
 import polars as pl
 
+from csrlite.common.config import config
 from csrlite.common.count import count_subject, count_subject_with_observation
 
 
@@ -36,6 +37,14 @@ class TestCountSubject(unittest.TestCase):
         self.assertNotIn("Total", result["TRT01A"].to_list())
         self.assertEqual(result.height, 2)
 
+    def test_count_subject_empty_population(self) -> None:
+        result = count_subject(
+            population=self.population_data.clear(), id="USUBJID", group="TRT01A", total=True
+        )
+
+        # No subjects, no groups and no Total row
+        self.assertEqual(result.height, 0)
+
     def test_count_subject_missing_group_error(self) -> None:
         pop_missing = pl.DataFrame({"USUBJID": ["01", "02"], "TRT01A": ["A", None]})
 
@@ -77,6 +86,45 @@ class TestCountSubject(unittest.TestCase):
         self.assertEqual(row_b_inf["n_subj"][0], 1)
         self.assertLess(abs(row_b_inf["pct_subj"][0] - 33.3), 0.1)
 
+    def test_count_subject_with_observation_total(self) -> None:
+        result = count_subject_with_observation(
+            population=self.population_data,
+            observation=self.observation_data,
+            id="USUBJID",
+            group="TRT01A",
+            variable="AESOC",
+            total=True,
+        )
+
+        # Total: 5 subjects. Infection: 01, 03 -> 2 subjects, 2 observations
+        row_total_inf = result.filter(
+            (pl.col("TRT01A") == "Total") & (pl.col("AESOC") == "Infection")
+        )
+        self.assertEqual(row_total_inf["n_subj"][0], 2)
+        self.assertEqual(row_total_inf["n_obs"][0], 2)
+        self.assertEqual(row_total_inf["n_subj_pop"][0], 5)
+        self.assertEqual(row_total_inf["pct_subj"][0], 40.0)
+
+    def test_count_subject_with_observation_streaming(self) -> None:
+        kwargs = dict(
+            population=self.population_data,
+            observation=self.observation_data,
+            id="USUBJID",
+            group="TRT01A",
+            variable="AESOC",
+            total=True,
+        )
+        expected = count_subject_with_observation(**kwargs)
+
+        threshold = config.streaming_threshold
+        config.streaming_threshold = 0
+        try:
+            result = count_subject_with_observation(**kwargs)
+        finally:
+            config.streaming_threshold = threshold
+
+        self.assertTrue(result.equals(expected))
+
     def test_count_subject_with_observation_missing_id_in_pop(self) -> None:
         obs_bad = pl.DataFrame(
             {
@@ -101,6 +101,48 @@ class TestIEArd(unittest.TestCase):
         # Assumption for now: Code logic is consistent with itself.
         self.assertEqual(row0["A"], "1 (100.0)")
 
+    def test_ie_df_rounds_ties_to_even(self) -> None:
+        """Percentages round like f"{pct:.1f}": exact ties go to the even digit."""
+        ard = pl.DataFrame(
+            {
+                "label": ["Row1", "Row2"],
+                "indent": [0, 0],
+                "is_header": [False, False],
+                "count_A": [9, 17],
+                "pct_A": [9 / 80 * 100, 17 / 80 * 100],
+            }
+        )
+        df = ie_df(ard)
+        self.assertEqual(df["A"].to_list(), ["9 (11.2)", "17 (21.2)"])
+
+    def test_ie_ard_pct_matches_division(self) -> None:
+        """ARD percentages equal n / denom * 100, so ties like 17/80 still display as 21.2."""
+        ids = [f"{i:02d}" for i in range(80)]
+        adsl = pl.DataFrame({"USUBJID": ids, "TRT01A": ["A"] * 80})
+        adie = pl.DataFrame(
+            {
+                "USUBJID": ids,
+                "PARAMCAT": ["EXCLUSION CRITERIA MET"] * 17 + ["INCLUSION CRITERIA NOT MET"] * 63,
+                "PARAM": ["Criterion X"] * 17 + ["Criterion Y"] * 63,
+            }
+        )
+        ard = ie_ard(adsl=adsl, adie=adie, group_col="TRT01A")
+
+        row_x = ard.filter(pl.col("label") == "Criterion X").row(0, named=True)
+        self.assertEqual(row_x["pct_A"], 17 / 80 * 100)
+        df = ie_df(ard.filter(pl.col("label") == "Criterion X"))
+        self.assertEqual(df["A"].to_list(), ["17 (21.2)"])
+
+    def test_ie_ard_group_from_adsl(self) -> None:
+        """Group comes from ADSL even when ADIE carries a column with the same name."""
+        adie = self.adie.with_columns(pl.lit("Other").alias("TRT01A"))
+        ard = ie_ard(adsl=self.adsl, adie=adie, group_col="TRT01A")
+
+        self.assertNotIn("count_Other", ard.columns)
+        row0 = ard.row(0, named=True)
+        self.assertEqual(row0["count_A"], 1)
+        self.assertEqual(row0["count_B"], 2)
+
     def test_ie_ard_no_group(self) -> None:
         """Test ARD generation without group column."""
         ard = ie_ard(adsl=self.adsl, adie=self.adie, group_col=None)
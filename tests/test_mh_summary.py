@@ -54,6 +54,24 @@ def test_mh_summary_ard(adsl_data: pl.DataFrame, admh_data: pl.DataFrame) -> Non
     assert row0["count_A"] == 1
 
 
+def test_mh_summary_ard_null_group() -> None:
+    """Subjects with a missing group are counted in their own column."""
+    adsl = pl.DataFrame({"USUBJID": ["1", "2", "3"], "TRT01A": [None, "A", "A"]})
+    admh = pl.DataFrame({"USUBJID": ["1", "2"], "MHBODSYS": ["S", "S"], "MHDECOD": ["T", "T"]})
+    ard = mh_summary_ard(
+        population=adsl,
+        observation=admh,
+        population_filter=None,
+        observation_filter=None,
+        group_col="TRT01A",
+        id_col="USUBJID",
+        variables=[("MHBODSYS", "SOC"), ("MHDECOD", "PT")],
+    )
+    assert ard["count_None"].to_list() == [1, 1, 1]
+    assert ard["count_A"].to_list() == [1, 1, 1]
+    assert ard["pct_None"].to_list() == [100.0, 100.0, 100.0]
+
+
 def test_mh_summary_ard_missing_obs(adsl_data: pl.DataFrame) -> None:
     """Test ValueError when obs data missing."""
     with pytest.raises(ValueError, match="Observation data is missing"):
@@ -109,6 +127,40 @@ def test_mh_summary_df(adsl_data: pl.DataFrame, admh_data: pl.DataFrame) -> None
     assert "Medical History" in df.columns
 
 
+def test_mh_summary_df_rounds_ties_to_even() -> None:
+    """Percentages round like f"{pct:.1f}": exact ties go to the even digit."""
+    ard = pl.DataFrame(
+        {
+            "label": ["Row1", "Row2", "Row3"],
+            "indent": [0, 0, 0],
+            "is_header": [False, False, False],
+            "count_A": [9, 17, 3],
+            "pct_A": [9 / 80 * 100, 17 / 80 * 100, 3 / 8 * 100],
+        }
+    )
+    df = mh_summary_df(ard)
+    assert df["A"].to_list() == ["9 (11.2)", "17 (21.2)", "3 (37.5)"]
+
+
+def test_mh_summary_ard_pct_matches_division() -> None:
+    """ARD percentages equal n / denom * 100, so ties like 17/80 still display as 21.2."""
+    adsl = pl.DataFrame({"USUBJID": [str(i) for i in range(80)], "TRT01A": ["A"] * 80})
+    admh = pl.DataFrame(
+        {"USUBJID": [str(i) for i in range(17)], "MHBODSYS": ["S"] * 17, "MHDECOD": ["T"] * 17}
+    )
+    ard = mh_summary_ard(
+        population=adsl,
+        observation=admh,
+        population_filter=None,
+        observation_filter=None,
+        group_col="TRT01A",
+        id_col="USUBJID",
+        variables=[("MHBODSYS", "SOC"), ("MHDECOD", "PT")],
+    )
+    assert ard["pct_A"].to_list() == [17 / 80 * 100] * 3
+    assert mh_summary_df(ard)["A"].to_list() == ["17 (21.2)"] * 3
+
+
 def test_mh_summary_df_empty() -> None:
     """Test empty DF."""
     df = mh_summary_df(pl.DataFrame())
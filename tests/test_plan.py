@@ -1,5 +1,6 @@
 # pyre-strict
 import unittest
+from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
 from csrlite.common.plan import KeywordRegistry, PlanExpander, StudyPlan
@@ -42,6 +43,7 @@ class TestPlan(unittest.TestCase):
 
         # 2 pops * 1 obs * 2 params = 4 plans
         self.assertEqual(len(plans), 4)
+        self.assertEqual(expander.count_plan(plan_data), 4)
 
         ids = {p.id for p in plans}
         self.assertIn("ae_summary_pop1_obs1_param1", ids)
@@ -61,3 +63,88 @@ class TestPlan(unittest.TestCase):
 
             self.assertIn("adsl", plan.datasets)
             self.assertIsNotNone(plan.keywords.get_data_source("adsl"))
+
+    def test_study_plan_datasets_load_lazily(self) -> None:
+        study_data = {
+            "data": [
+                {"name": "adsl", "path": "adsl.parquet"},
+                {"name": "adae", "path": "missing.parquet"},
+                {"name": "adlb", "path": "adlb.parquet"},
+            ],
+        }
+
+        def read(path: Any) -> str:
+            if path.name == "missing.parquet":
+                raise FileNotFoundError(path)
+            return path.name
+
+        with patch("csrlite.common.plan.pl.read_parquet", side_effect=read) as mock_read:
+            plan = StudyPlan(study_data)
+            # Nothing is read until a dataset is needed
+            mock_read.assert_not_called()
+            self.assertEqual(plan.datasets.get("adsl"), "adsl.parquet")
+            self.assertIsNone(plan.datasets.get("adae"))
+            # A failed read is remembered rather than retried
+            self.assertNotIn("adae", plan.datasets)
+            self.assertEqual(mock_read.call_count, 2)
+            plan.load_datasets()
+            self.assertEqual(mock_read.call_count, 3)
+            df_ds = plan.get_dataset_df()
+
+        self.assertEqual(plan.datasets, {"adsl": "adsl.parquet", "adlb": "adlb.parquet"})
+        self.assertIn("adlb", plan.datasets)
+        self.assertIsNotNone(df_ds)
+        self.assertEqual(df_ds["loaded"].to_list(), [True, False, True])
+
+    def test_plan_expander_title_and_id(self) -> None:
+        registry = KeywordRegistry()
+        registry.load_from_dict(
+            {
+                "population": [{"name": "pop1", "label": "Safety"}],
+                "observation": [{"name": "obs1"}],
+                "parameter": [{"name": "param1", "label": "Any AE"}],
+            }
+        )
+        expander = PlanExpander(registry)
+
+        (plan,) = expander.expand_plan(
+            {
+                "analysis": "ae_summary",
+                "population": "pop1",
+                "observation": "obs1",
+                "parameter": "param1",
+            }
+        )
+
+        self.assertEqual(plan.id, "ae_summary_pop1_obs1_param1")
+        # The ID follows the fields, including on copies
+        copied = plan.model_copy(update={"population": "pop2"})
+        self.assertEqual(copied.id, "ae_summary_pop2_obs1_param1")
+        # Keywords without a label are skipped
+        self.assertEqual(expander._generate_title(plan), "Ae Summary - Safety - Any AE")
+
+    def test_plan_expander_expand_columns(self) -> None:
+        expander = PlanExpander(KeywordRegistry())
+        plan_data = {
+            "analysis": "ae_summary",
+            "population": ["pop1", "pop2"],
+            "observation": ["obs1", "obs2"],
+            "parameter": "param1",
+            "group": "trt",
+        }
+        columns: Dict[str, List[Any]] = {
+            k: [] for k in ("analysis", "population", "observation", "parameter", "group")
+        }
+        expander.expand_columns(plan_data, columns)
+
+        expected = [p.model_dump() for p in expander.expand_plan(plan_data)]
+        self.assertEqual([dict(zip(columns, row)) for row in zip(*columns.values())], expected)
+
+        with self.assertRaises(ValueError):
+            expander.expand_columns({"analysis": "ae_summary", "population": [1]}, columns)
+        with self.assertRaises(ValueError):
+            expander.expand_columns({"analysis": 1, "population": "pop1"}, columns)
+        with self.assertRaises(ValueError):
+            expander.expand_plan({"analysis": "ae_summary", "population": [1]})
+        with self.assertRaises(ValueError):
+            expander.expand_plan({"analysis": 1, "population": "pop1"})
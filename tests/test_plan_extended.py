@@ -76,6 +76,7 @@ class TestPlanExtended(unittest.TestCase):
         s = str(plan)
         self.assertIn("StudyPlan(study='Test Study'", s)
         self.assertIn("plans=1", s)
+        self.assertIn("analyses=1", s)
 
     @patch("csrlite.common.plan.pl.read_parquet")
     def test_empty_plan(self, mock_read):
@@ -112,6 +113,10 @@ class TestPlanExtended(unittest.TestCase):
         reg2.load_from_dict(data2)
         self.assertEqual(reg2.groups["g2"].group_label, ["X", "Y"])
 
+        # Loaded keywords are read-only
+        with self.assertRaises(ValueError):
+            reg2.groups["g2"].variable = "v3"
+
     def test_load_plan_wrapper(self):
         import os
 
@@ -3,7 +3,7 @@ import unittest
 
 import polars as pl
 
-from csrlite.common.utils import apply_common_filters
+from csrlite.common.utils import apply_common_filters, sql_expr
 
 
 class TestUtils(unittest.TestCase):
@@ -70,3 +70,21 @@ class TestUtils(unittest.TestCase):
         self.assertTrue(res_pop.equals(expected_pop))
         self.assertIsNotNone(res_obs)
         self.assertTrue(res_obs.equals(expected_obs))
+
+    def test_sql_expr_cached(self) -> None:
+        df = pl.DataFrame({"val": [10, 20, 30]})
+
+        expr = sql_expr("val > 15")
+
+        self.assertIs(sql_expr("val > 15"), expr)
+        self.assertEqual(df.filter(expr)["val"].to_list(), [20, 30])
+
+    def test_apply_common_filters_lazy_observation(self) -> None:
+        pop = pl.DataFrame({"id": [1, 2, 3]})
+        obs = pl.DataFrame({"id": [1, 2, 3], "val": [10, 20, 30], "param": ["X", "Y", "X"]})
+
+        _, res_obs = apply_common_filters(pop, obs.lazy(), None, "val > 15", "param == 'X'")
+
+        self.assertIsInstance(res_obs, pl.LazyFrame)
+        assert res_obs is not None
+        self.assertEqual(res_obs.collect()["id"].to_list(), [3])
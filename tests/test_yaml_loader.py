@@ -1,4 +1,5 @@
 # pyre-strict
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import mock_open, patch
@@ -22,6 +23,17 @@ class TestYamlLoader(unittest.TestCase):
                 data = self.loader.load("test.yaml")
                 self.assertEqual(data, {"key": "value"})
 
+    def test_load_returns_independent_copies(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            Path(tmp_dir, "test.yaml").write_text("group:\n  - name: trt\n    label: [A, B]")
+            loader = YamlInheritanceLoader(base_path=Path(tmp_dir))
+
+            first = loader.load("test.yaml")
+            first["group"][0].pop("label")
+            second = loader.load("test.yaml")
+
+        self.assertEqual(second["group"][0]["label"], ["A", "B"])
+
     def test_resolve_inheritance_no_template(self) -> None:
         data = {"key": "value"}
         resolved = self.loader._resolve_inheritance(data)